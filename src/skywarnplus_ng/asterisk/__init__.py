@@ -2,9 +2,13 @@
 Asterisk integration for SkywarnPlus-NG.
 """
 
-from .courtesy_tone import CourtesyToneError, CourtesyToneManager
-from .id_change import IDChangeError, IDChangeManager
-from .manager import AsteriskError, AsteriskManager
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .courtesy_tone import CourtesyToneError, CourtesyToneManager
+    from .id_change import IDChangeError, IDChangeManager
+    from .manager import AsteriskError, AsteriskManager
 
 __all__ = [
     "AsteriskError",
@@ -14,3 +18,22 @@ __all__ = [
     "IDChangeError",
     "IDChangeManager",
 ]
+
+# Submodules are imported on first attribute access, so importing one of them
+# (e.g. skycontrol's courtesy tone command) does not load the others.
+_LAZY_ATTRS = {
+    "AsteriskError": ".manager",
+    "AsteriskManager": ".manager",
+    "CourtesyToneError": ".courtesy_tone",
+    "CourtesyToneManager": ".courtesy_tone",
+    "IDChangeError": ".id_change",
+    "IDChangeManager": ".id_change",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        return getattr(import_module(module_name, __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
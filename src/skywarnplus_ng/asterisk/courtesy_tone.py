@@ -6,12 +6,14 @@ manages dynamically switching between "normal" and "wx" (weather alert) mode
 tones based on active weather alerts.
 """
 
-import fnmatch
 import logging
-import shutil
+import os
 from pathlib import Path
+from typing import Any
 
 from ..core.models import WeatherAlert
+from ..utils.atomic_link import atomic_link
+from ..utils.event_patterns import EventPatternMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,7 @@ class CourtesyToneManager:
         tones_config: dict[str, dict[str, str]],
         ct_alerts: list[str],
         state_manager=None,
+        state: dict[str, Any] | None = None,
     ):
         """
         Initialize courtesy tone manager.
@@ -41,19 +44,31 @@ class CourtesyToneManager:
                          Example: {"ct1": {"Normal": "Boop.ulaw", "WX": "Stardust.ulaw"}}
             ct_alerts: List of alert events that trigger WX mode
             state_manager: Optional state manager to track current mode
+            state: Optional caller-owned state dict; when given, the mode is recorded
+                   there for the caller to persist instead of via state_manager
         """
         self.enabled = enabled
         self.tone_dir = Path(tone_dir)
         self.tones_config = tones_config
         self.ct_alerts = ct_alerts
+        self._ct_matcher = EventPatternMatcher(ct_alerts)
         self.state_manager = state_manager
+        self.state = state
         self.current_mode: str | None = None
 
         # Ensure tone directory exists
         self.tone_dir.mkdir(parents=True, exist_ok=True)
 
+        # Resolve (ct_key, tone, source, dest) per mode once; config is fixed for our lifetime
+        self._mode_plan = {
+            "normal": self._build_mode_plan("Normal"),
+            "wx": self._build_mode_plan("WX"),
+        }
+
         # Load current mode from state on initialization
-        if self.state_manager:
+        if self.state is not None:
+            self.current_mode = self.state.get("ct")
+        elif self.state_manager:
             try:
                 state = self.state_manager.load_state()
                 self.current_mode = state.get("ct")
@@ -67,6 +82,31 @@ class CourtesyToneManager:
         else:
             logger.info(f"Courtesy tone manager initialized (tone_dir: {self.tone_dir})")
 
+    def _build_mode_plan(self, mode_key: str) -> list[tuple[str, str, Path, Path]]:
+        """
+        Resolve source and destination tone paths for one mode.
+
+        Args:
+            mode_key: Tone settings key ('Normal' or 'WX')
+
+        Returns:
+            List of (ct_key, tone file, source path, destination path)
+        """
+        plan = []
+        for ct_key, tone_settings in self.tones_config.items():
+            target_tone_file = tone_settings.get(mode_key)
+            if not target_tone_file:
+                logger.warning(f"No {mode_key} tone configured for {ct_key}, skipping")
+                continue
+
+            # Destination keeps the source extension: tone_dir/ct_key.ulaw
+            source_file = self.tone_dir / target_tone_file
+            dest_ext = source_file.suffix if source_file.suffix else ".ulaw"
+            plan.append(
+                (ct_key, target_tone_file, source_file, self.tone_dir / f"{ct_key}{dest_ext}")
+            )
+        return plan
+
     def _has_wx_alerts(self, alerts: list[WeatherAlert]) -> bool:
         """
         Check if any active alerts match the CT trigger list.
@@ -77,43 +117,48 @@ class CourtesyToneManager:
         Returns:
             True if any alert matches CT trigger list
         """
-        if not self.ct_alerts:
+        if not self._ct_matcher:
             return False
 
-        alert_events = {alert.event for alert in alerts}
-
-        for alert_event in alert_events:
-            for ct_alert_pattern in self.ct_alerts:
-                if fnmatch.fnmatch(alert_event, ct_alert_pattern):
-                    logger.debug(
-                        f"Alert {alert_event} matches CT trigger pattern: {ct_alert_pattern}"
-                    )
-                    return True
+        for alert in alerts:
+            if self._ct_matcher.match(alert.event):
+                logger.debug(f"Alert {alert.event} matches CT trigger list")
+                return True
 
         return False
 
-    def _copy_tone_file(self, source_file: Path, dest_file: Path) -> bool:
+    def _link_tone_file(self, source_file: Path, dest_file: Path) -> bool:
         """
-        Copy a tone file from source to destination.
+        Point a destination tone file at a source tone file.
+
+        The destination is atomically replaced with a relative symlink to the source
+        (falling back to a copy where symlinks are unsupported). Nothing is done when
+        the destination already resolves to the source file.
 
         Args:
             source_file: Source tone file path
             dest_file: Destination tone file path
 
         Returns:
-            True if copy was successful
+            True if the destination now matches the source
         """
         try:
-            if not source_file.exists():
-                logger.error(f"Source tone file does not exist: {source_file}")
-                return False
+            # samefile stats both files (following links), doubling as the existence check
+            try:
+                if os.path.samefile(source_file, dest_file):
+                    logger.debug(f"Tone file already up to date: {dest_file}")
+                    return True
+            except FileNotFoundError:
+                if not source_file.exists():
+                    logger.error(f"Source tone file does not exist: {source_file}")
+                    return False
 
-            shutil.copyfile(source_file, dest_file)
-            logger.debug(f"Copied tone file: {source_file} -> {dest_file}")
+            atomic_link(source_file, dest_file)
+            logger.debug(f"Linked tone file: {dest_file} -> {source_file}")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to copy tone file {source_file} to {dest_file}: {e}")
+            logger.error(f"Failed to link tone file {dest_file} to {source_file}: {e}")
             return False
 
     def change_mode(self, mode: str) -> bool:
@@ -142,25 +187,9 @@ class CourtesyToneManager:
         logger.info(f"Changing courtesy tones to {mode} mode")
 
         changed = False
-        mode_key = "Normal" if mode == "normal" else "WX"
-
-        for ct_key, tone_settings in self.tones_config.items():
-            # Get target tone file for this mode
-            target_tone_file = tone_settings.get(mode_key)
-
-            if not target_tone_file:
-                logger.warning(f"No {mode_key} tone configured for {ct_key}, skipping")
-                continue
-
-            # Source file: tone_dir/target_tone_file
-            source_file = self.tone_dir / target_tone_file
-
-            # Destination file: tone_dir/ct_key.ulaw (or whatever extension source has)
-            # Preserve extension from source file
-            dest_ext = source_file.suffix if source_file.suffix else ".ulaw"
-            dest_file = self.tone_dir / f"{ct_key}{dest_ext}"
 
-            if self._copy_tone_file(source_file, dest_file):
+        for ct_key, target_tone_file, source_file, dest_file in self._mode_plan[mode]:
+            if self._link_tone_file(source_file, dest_file):
                 logger.info(f"Updated {ct_key} to {mode} mode with tone {target_tone_file}")
                 changed = True
             else:
@@ -170,8 +199,10 @@ class CourtesyToneManager:
             self.current_mode = mode
             logger.info(f"Courtesy tones changed to {mode} mode")
 
-            # Update state if state manager is available
-            if self.state_manager:
+            # Record mode in the caller's state, or persist it via the state manager
+            if self.state is not None:
+                self.state["ct"] = mode
+            elif self.state_manager:
                 try:
                     state = self.state_manager.load_state()
                     state["ct"] = mode
@@ -5,12 +5,13 @@ ID changes allow dynamically switching the node identifier audio file
 between "normal" and "wx" (weather alert) mode based on active weather alerts.
 """
 
-import fnmatch
 import logging
-import shutil
 from pathlib import Path
+from typing import Any
 
 from ..core.models import WeatherAlert
+from ..utils.atomic_link import atomic_link
+from ..utils.event_patterns import EventPatternMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,7 @@ class IDChangeManager:
         rpt_id: str,
         id_alerts: list[str],
         state_manager=None,
+        state: dict[str, Any] | None = None,
     ):
         """
         Initialize ID change manager.
@@ -43,6 +45,8 @@ class IDChangeManager:
             rpt_id: Filename that Asterisk uses (e.g., "RPTID.ulaw")
             id_alerts: List of alert events that trigger WX mode
             state_manager: Optional state manager to track current mode
+            state: Optional caller-owned state dict; when given, the mode is recorded
+                   there for the caller to persist instead of via state_manager
         """
         self.enabled = enabled
         self.id_dir = Path(id_dir)
@@ -50,14 +54,20 @@ class IDChangeManager:
         self.wx_id = wx_id
         self.rpt_id = rpt_id
         self.id_alerts = id_alerts
+        self._id_matcher = EventPatternMatcher(id_alerts)
+        self._last_events: frozenset[str] | None = None
+        self._last_target: str | None = None
         self.state_manager = state_manager
+        self.state = state
         self.current_mode: str | None = None
 
         # Ensure ID directory exists
         self.id_dir.mkdir(parents=True, exist_ok=True)
 
         # Load current mode from state on initialization
-        if self.state_manager:
+        if self.state is not None:
+            self.current_mode = self.state.get("id")
+        elif self.state_manager:
             try:
                 state = self.state_manager.load_state()
                 self.current_mode = state.get("id")
@@ -73,53 +83,51 @@ class IDChangeManager:
                 f"ID change manager initialized (id_dir: {self.id_dir}, rpt_id: {self.rpt_id})"
             )
 
-    def _has_wx_alerts(self, alerts: list[WeatherAlert]) -> bool:
+    def _has_wx_alerts(self, alert_events: frozenset[str]) -> bool:
         """
-        Check if any active alerts match the ID trigger list.
+        Check if any active alert events match the ID trigger list.
 
         Args:
-            alerts: List of active alerts
+            alert_events: Event names of the active alerts
 
         Returns:
             True if any alert matches ID trigger list
         """
-        if not self.id_alerts:
+        if not self._id_matcher:
             return False
 
-        alert_events = {alert.event for alert in alerts}
-
         for alert_event in alert_events:
-            for id_alert_pattern in self.id_alerts:
-                if fnmatch.fnmatch(alert_event, id_alert_pattern):
-                    logger.debug(
-                        f"Alert {alert_event} matches ID trigger pattern: {id_alert_pattern}"
-                    )
-                    return True
+            if self._id_matcher.match(alert_event):
+                logger.debug(f"Alert {alert_event} matches ID trigger list")
+                return True
 
         return False
 
-    def _copy_id_file(self, source_file: Path, dest_file: Path) -> bool:
+    def _link_id_file(self, source_file: Path, dest_file: Path) -> bool:
         """
-        Copy an ID file from source to destination.
+        Point the destination ID file at a source ID file.
+
+        The destination is atomically replaced with a relative symlink to the source
+        (falling back to a copy where symlinks are unsupported).
 
         Args:
             source_file: Source ID file path
             dest_file: Destination ID file path
 
         Returns:
-            True if copy was successful
+            True if the destination now matches the source
         """
         try:
             if not source_file.exists():
                 logger.error(f"Source ID file does not exist: {source_file}")
                 return False
 
-            shutil.copyfile(source_file, dest_file)
-            logger.debug(f"Copied ID file: {source_file} -> {dest_file}")
+            atomic_link(source_file, dest_file)
+            logger.debug(f"Linked ID file: {dest_file} -> {source_file}")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to copy ID file {source_file} to {dest_file}: {e}")
+            logger.error(f"Failed to link ID file {dest_file} to {source_file}: {e}")
             return False
 
     def change_mode(self, mode: str) -> bool:
@@ -156,12 +164,14 @@ class IDChangeManager:
         source_file = self.id_dir / source_filename
         dest_file = self.id_dir / self.rpt_id
 
-        if self._copy_id_file(source_file, dest_file):
+        if self._link_id_file(source_file, dest_file):
             self.current_mode = mode
-            logger.info(f"ID changed to {mode} mode (copied {source_filename} to {self.rpt_id})")
+            logger.info(f"ID changed to {mode} mode ({self.rpt_id} -> {source_filename})")
 
-            # Update state if state manager is available
-            if self.state_manager:
+            # Record mode in the caller's state, or persist it via the state manager
+            if self.state is not None:
+                self.state["id"] = mode
+            elif self.state_manager:
                 try:
                     state = self.state_manager.load_state()
                     state["id"] = mode
@@ -188,9 +198,16 @@ class IDChangeManager:
         if not self.enabled:
             return False
 
+        # Same events as the last poll and the ID already reflects them: nothing to do
+        alert_events = frozenset(alert.event for alert in alerts)
+        if alert_events == self._last_events and self.current_mode == self._last_target:
+            return False
+
         # Determine if we should be in WX mode
-        should_be_wx = self._has_wx_alerts(alerts)
+        should_be_wx = self._has_wx_alerts(alert_events)
         target_mode = "WX" if should_be_wx else "NORMAL"
+        self._last_events = alert_events
+        self._last_target = target_mode
 
         return self.change_mode(target_mode)
 
@@ -208,6 +208,14 @@ class SkywarnPlusApplication:
         else:
             logger.info("Asterisk integration disabled in configuration")
 
+        # Handle cleanslate mode
+        if self.config.dev.cleanslate:
+            logger.info("DEV: Cleanslate mode enabled, clearing cached state")
+            self.state_manager.clear_state()
+
+        # Load initial state (courtesy tone and ID modes are recorded here and saved each poll)
+        self.state = self.state_manager.load_state()
+
         # Initialize courtesy tone manager
         if self.config.asterisk.courtesy_tones.enabled:
             try:
@@ -216,7 +224,7 @@ class SkywarnPlusApplication:
                     tone_dir=self.config.asterisk.courtesy_tones.tone_dir,
                     tones_config=self.config.asterisk.courtesy_tones.tones,
                     ct_alerts=self.config.asterisk.courtesy_tones.ct_alerts,
-                    state_manager=self.state_manager,
+                    state=self.state,
                 )
                 logger.info("Courtesy tone manager initialized successfully")
             except Exception as e:
@@ -236,7 +244,7 @@ class SkywarnPlusApplication:
                     wx_id=self.config.asterisk.id_change.wx_id,
                     rpt_id=self.config.asterisk.id_change.rpt_id,
                     id_alerts=self.config.asterisk.id_change.id_alerts,
-                    state_manager=self.state_manager,
+                    state=self.state,
                 )
                 logger.info("ID change manager initialized successfully")
             except Exception as e:
@@ -359,13 +367,6 @@ class SkywarnPlusApplication:
         else:
             logger.info("Notification manager disabled (no channels configured)")
 
-        # Handle cleanslate mode
-        if self.config.dev.cleanslate:
-            logger.info("DEV: Cleanslate mode enabled, clearing cached state")
-            self.state_manager.clear_state()
-
-        # Load initial state
-        self.state = self.state_manager.load_state()
         logger.info("Application initialized successfully")
 
     def _initialize_processing_pipeline(self) -> None:
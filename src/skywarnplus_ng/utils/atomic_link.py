@@ -0,0 +1,40 @@
+"""Atomic symlink replacement helper."""
+
+from __future__ import annotations
+
+import os
+import secrets
+import shutil
+import tempfile
+from pathlib import Path
+
+
+def atomic_link(source: Path, dest: Path) -> None:
+    """
+    Atomically point dest at source.
+
+    A relative symlink to source (or a copy, where symlinks are unsupported) is staged
+    under a unique name beside dest and swapped in with os.replace, so a symlinked dest
+    is replaced rather than followed and concurrent callers never share a staging entry.
+    """
+    staged: Path | None = None
+    try:
+        candidate = dest.with_name(f".{dest.name}-{secrets.token_hex(8)}.tmp")
+        try:
+            os.symlink(os.path.relpath(source, dest.parent), candidate)
+            staged = candidate
+        except OSError:
+            fd, tmp_path = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}-", suffix=".tmp")
+            os.close(fd)
+            staged = Path(tmp_path)
+            shutil.copyfile(source, staged)
+            # mkstemp creates 0600; give the live file the source's permissions
+            shutil.copymode(source, staged)
+        os.replace(staged, dest)
+    except Exception:
+        if staged is not None:
+            try:
+                os.unlink(staged)
+            except OSError:
+                pass
+        raise
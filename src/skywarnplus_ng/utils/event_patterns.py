@@ -0,0 +1,36 @@
+"""
+Matching of alert event names against fnmatch-style trigger patterns.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Iterable
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+class EventPatternMatcher:
+    """Match event names against a fixed list of patterns (exact names or fnmatch globs).
+
+    Exact names are checked with a set lookup; globs are translated once into a single
+    compiled alternation regex. Matching is case-sensitive, as fnmatch is on POSIX.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        patterns = list(patterns)
+        self.literals = frozenset(p for p in patterns if _GLOB_CHARS.isdisjoint(p))
+        globs = [p for p in patterns if p not in self.literals]
+        self.pattern: re.Pattern[str] | None = (
+            re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs)) if globs else None
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.literals) or self.pattern is not None
+
+    def match(self, event: str) -> bool:
+        """Return True if event equals a literal pattern or matches a glob."""
+        if event in self.literals:
+            return True
+        return self.pattern is not None and self.pattern.match(event) is not None
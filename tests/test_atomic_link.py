@@ -0,0 +1,57 @@
+"""Tests for atomic symlink replacement."""
+
+import os
+import stat
+
+import pytest
+
+from skywarnplus_ng.utils import atomic_link as atomic_link_module
+from skywarnplus_ng.utils.atomic_link import atomic_link
+
+
+def test_replaces_symlinked_dest_without_touching_old_target(tmp_path):
+    old = tmp_path / "old.ulaw"
+    new = tmp_path / "new.ulaw"
+    old.write_bytes(b"old")
+    new.write_bytes(b"new")
+    dest = tmp_path / "ct1.ulaw"
+    dest.symlink_to("old.ulaw")
+
+    atomic_link(new, dest)
+
+    assert os.readlink(dest) == "new.ulaw"
+    assert old.read_bytes() == b"old"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ct1.ulaw", "new.ulaw", "old.ulaw"]
+
+
+def test_copies_when_symlinks_unsupported(tmp_path, monkeypatch):
+    source = tmp_path / "new.ulaw"
+    source.write_bytes(b"new")
+    source.chmod(0o644)
+    dest = tmp_path / "ct1.ulaw"
+    dest.symlink_to("new.ulaw")
+
+    def _no_symlink(*_args, **_kwargs):
+        raise OSError("symlinks not supported")
+
+    monkeypatch.setattr(atomic_link_module.os, "symlink", _no_symlink)
+    atomic_link(source, dest)
+
+    assert not dest.is_symlink()
+    assert dest.read_bytes() == b"new"
+    assert stat.S_IMODE(dest.stat().st_mode) == 0o644
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ct1.ulaw", "new.ulaw"]
+
+
+def test_removes_staged_entry_on_failure(tmp_path, monkeypatch):
+    source = tmp_path / "new.ulaw"
+    source.write_bytes(b"new")
+
+    def _fail_replace(*_args, **_kwargs):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(atomic_link_module.os, "replace", _fail_replace)
+    with pytest.raises(OSError):
+        atomic_link(source, tmp_path / "ct1.ulaw")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["new.ulaw"]
@@ -0,0 +1,132 @@
+"""Tests for courtesy tone mode switching."""
+
+import os
+from datetime import UTC, datetime
+
+from skywarnplus_ng.asterisk.courtesy_tone import CourtesyToneManager
+from skywarnplus_ng.core.models import WeatherAlert
+
+
+def _alert(event: str) -> WeatherAlert:
+    now = datetime.now(UTC)
+    return WeatherAlert(
+        id=f"urn:test:{event}",
+        event=event,
+        description="Test",
+        sent=now,
+        effective=now,
+        expires=now,
+        area_desc="Brazoria, TX",
+        sender="test",
+        sender_name="NWS",
+    )
+
+
+def _manager(tmp_path, ct_alerts):
+    return CourtesyToneManager(
+        enabled=True,
+        tone_dir=tmp_path,
+        tones_config={"ct1": {"Normal": "Boop.ulaw", "WX": "Stardust.ulaw"}},
+        ct_alerts=ct_alerts,
+    )
+
+
+def test_has_wx_alerts_literal_and_glob(tmp_path):
+    mgr = _manager(tmp_path, ["Tornado Warning", "*Watch"])
+    assert mgr._has_wx_alerts([_alert("Tornado Warning")])
+    assert mgr._has_wx_alerts([_alert("Flood Advisory"), _alert("Severe Thunderstorm Watch")])
+    assert not mgr._has_wx_alerts([_alert("Flood Advisory")])
+    assert not mgr._has_wx_alerts([_alert("Tornado Warning Test")])
+    assert not mgr._has_wx_alerts([])
+
+
+def test_has_wx_alerts_literal_only_triggers(tmp_path):
+    mgr = _manager(tmp_path, ["Tornado Warning"])
+    assert mgr._ct_matcher.pattern is None
+    assert mgr._has_wx_alerts([_alert("Tornado Warning")])
+    assert not mgr._has_wx_alerts([_alert("Tornado Watch")])
+
+
+def test_has_wx_alerts_empty_trigger_list(tmp_path):
+    mgr = _manager(tmp_path, [])
+    assert not mgr._has_wx_alerts([_alert("Tornado Warning")])
+
+
+def test_change_mode_switches_same_size_tones(tmp_path):
+    (tmp_path / "Boop.ulaw").write_bytes(b"normal")
+    (tmp_path / "Stardust.ulaw").write_bytes(b"wxtone")
+    mgr = _manager(tmp_path, ["Tornado Warning"])
+
+    assert mgr.change_mode("wx")
+    assert (tmp_path / "ct1.ulaw").read_bytes() == b"wxtone"
+    assert mgr.change_mode("normal")
+    assert (tmp_path / "ct1.ulaw").read_bytes() == b"normal"
+    assert (tmp_path / "Stardust.ulaw").read_bytes() == b"wxtone"
+
+
+def test_change_mode_links_tone_file(tmp_path):
+    (tmp_path / "Boop.ulaw").write_bytes(b"normal")
+    (tmp_path / "Stardust.ulaw").write_bytes(b"wxtone")
+    mgr = _manager(tmp_path, [])
+
+    assert mgr.change_mode("wx")
+    dest = tmp_path / "ct1.ulaw"
+    assert dest.is_symlink()
+    assert dest.resolve() == (tmp_path / "Stardust.ulaw").resolve()
+    assert not list(tmp_path.glob(".ct1.ulaw-*.tmp"))
+
+
+def test_change_mode_skips_relink_when_already_pointing_at_source(tmp_path):
+    (tmp_path / "Boop.ulaw").write_bytes(b"normal")
+    (tmp_path / "Stardust.ulaw").write_bytes(b"wxtone")
+    dest = tmp_path / "ct1.ulaw"
+    dest.symlink_to("Boop.ulaw")
+    inode_before = dest.lstat().st_ino
+    mgr = _manager(tmp_path, [])
+
+    assert mgr.change_mode("normal")
+    assert mgr.current_mode == "normal"
+    assert dest.lstat().st_ino == inode_before
+
+
+def test_change_mode_relinks_equal_size_and_mtime_tones(tmp_path):
+    boop = tmp_path / "Boop.ulaw"
+    stardust = tmp_path / "Stardust.ulaw"
+    boop.write_bytes(b"normal")
+    stardust.write_bytes(b"wxtone")
+    os.utime(boop, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(stardust, ns=(1_000_000_000, 1_000_000_000))
+    dest = tmp_path / "ct1.ulaw"
+    dest.symlink_to("Boop.ulaw")
+    mgr = _manager(tmp_path, [])
+
+    assert mgr.change_mode("normal")
+    assert mgr.change_mode("wx")
+    assert dest.read_bytes() == b"wxtone"
+    assert mgr.change_mode("normal")
+    assert dest.resolve() == boop.resolve()
+    assert dest.read_bytes() == b"normal"
+
+
+def test_change_mode_records_mode_in_caller_state(tmp_path):
+    (tmp_path / "Stardust.ulaw").write_bytes(b"wxtone")
+    state = {"ct": "normal"}
+    mgr = CourtesyToneManager(
+        enabled=True,
+        tone_dir=tmp_path,
+        tones_config={"ct1": {"Normal": "Boop.ulaw", "WX": "Stardust.ulaw"}},
+        ct_alerts=[],
+        state=state,
+    )
+    assert mgr.current_mode == "normal"
+
+    assert mgr.change_mode("wx")
+    assert state["ct"] == "wx"
+
+
+def test_change_mode_missing_source_leaves_mode_unchanged(tmp_path):
+    mgr = _manager(tmp_path, [])
+
+    assert not mgr.change_mode("wx")
+    assert mgr.current_mode is None
+    assert not (tmp_path / "ct1.ulaw").is_symlink()
@@ -0,0 +1,25 @@
+"""Tests for alert event pattern matching."""
+
+from skywarnplus_ng.utils.event_patterns import EventPatternMatcher
+
+
+def test_literals_skip_regex():
+    matcher = EventPatternMatcher(["Tornado Warning", "Flash Flood Warning"])
+    assert matcher.pattern is None
+    assert matcher.match("Tornado Warning")
+    assert not matcher.match("Tornado Warning Test")
+
+
+def test_globs_combined_with_literals():
+    matcher = EventPatternMatcher(["Tornado Warning", "*Watch", "Winter Storm [WA]*"])
+    assert matcher.match("Tornado Warning")
+    assert matcher.match("Severe Thunderstorm Watch")
+    assert matcher.match("Winter Storm Warning")
+    assert not matcher.match("Winter Storm Outlook")
+    assert not matcher.match("tornado watch ")
+
+
+def test_empty_matcher_is_falsy():
+    matcher = EventPatternMatcher([])
+    assert not matcher
+    assert not matcher.match("Tornado Warning")
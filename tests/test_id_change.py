@@ -0,0 +1,116 @@
+"""Tests for ID file mode switching."""
+
+from datetime import UTC, datetime
+
+from skywarnplus_ng.asterisk.id_change import IDChangeManager
+from skywarnplus_ng.core.models import WeatherAlert
+
+
+def _alert(event: str) -> WeatherAlert:
+    now = datetime.now(UTC)
+    return WeatherAlert(
+        id=f"urn:test:{event}",
+        event=event,
+        description="Test",
+        sent=now,
+        effective=now,
+        expires=now,
+        area_desc="Brazoria, TX",
+        sender="test",
+        sender_name="NWS",
+    )
+
+
+def _manager(tmp_path, id_alerts):
+    (tmp_path / "NORMALID.ulaw").write_bytes(b"normal")
+    (tmp_path / "WXID.ulaw").write_bytes(b"wxid!!")
+    return IDChangeManager(
+        enabled=True,
+        id_dir=tmp_path,
+        normal_id="NORMALID.ulaw",
+        wx_id="WXID.ulaw",
+        rpt_id="RPTID.ulaw",
+        id_alerts=id_alerts,
+    )
+
+
+def test_update_id_switches_rpt_id(tmp_path):
+    mgr = _manager(tmp_path, ["Tornado Warning"])
+    rpt_id = tmp_path / "RPTID.ulaw"
+
+    assert mgr.update_id([_alert("Tornado Warning")])
+    assert mgr.current_mode == "WX"
+    assert rpt_id.read_bytes() == b"wxid!!"
+    assert not list(tmp_path.glob(".RPTID.ulaw-*.tmp"))
+
+    assert mgr.update_id([])
+    assert mgr.current_mode == "NORMAL"
+    assert rpt_id.read_bytes() == b"normal"
+    assert (tmp_path / "WXID.ulaw").read_bytes() == b"wxid!!"
+
+
+def test_change_mode_missing_source_fails(tmp_path):
+    mgr = _manager(tmp_path, [])
+    (tmp_path / "WXID.ulaw").unlink()
+
+    assert not mgr.change_mode("wx")
+    assert mgr.current_mode is None
+
+
+def test_has_wx_alerts_matches_any_event(tmp_path):
+    mgr = _manager(tmp_path, ["*Warning"])
+
+    assert mgr._has_wx_alerts(frozenset({"Flood Advisory", "Tornado Warning"}))
+    assert not mgr._has_wx_alerts(frozenset({"Flood Advisory"}))
+    assert not mgr._has_wx_alerts(frozenset())
+
+
+def test_update_id_follows_alert_changes(tmp_path):
+    mgr = _manager(tmp_path, ["Tornado Warning"])
+    warning = [_alert("Tornado Warning")]
+
+    assert mgr.update_id(warning)
+    assert mgr.update_id([_alert("Flood Advisory")])
+    assert mgr.current_mode == "NORMAL"
+    assert mgr.update_id(warning)
+    assert mgr.current_mode == "WX"
+
+
+def test_update_id_short_circuits_unchanged_events(tmp_path, monkeypatch):
+    mgr = _manager(tmp_path, ["Tornado Warning"])
+    alerts = [_alert("Tornado Warning")]
+    assert mgr.update_id(alerts)
+
+    def _fail(_alert_events):
+        raise AssertionError("trigger list should not be re-evaluated")
+
+    monkeypatch.setattr(mgr, "_has_wx_alerts", _fail)
+    assert not mgr.update_id(alerts)
+
+
+def test_update_id_reapplies_after_forced_mode(tmp_path):
+    mgr = _manager(tmp_path, ["Tornado Warning"])
+    alerts = [_alert("Tornado Warning")]
+    assert mgr.update_id(alerts)
+    assert mgr.force_mode("normal")
+
+    assert mgr.update_id(alerts)
+    assert mgr.current_mode == "WX"
+
+
+def test_change_mode_records_mode_in_caller_state(tmp_path):
+    (tmp_path / "WXID.ulaw").write_bytes(b"wxid!!")
+    state = {"id": "NORMAL"}
+    mgr = IDChangeManager(
+        enabled=True,
+        id_dir=tmp_path,
+        normal_id="NORMALID.ulaw",
+        wx_id="WXID.ulaw",
+        rpt_id="RPTID.ulaw",
+        id_alerts=[],
+        state=state,
+    )
+    assert mgr.current_mode == "NORMAL"
+
+    assert mgr.change_mode("wx")
+    assert state["id"] == "WX"